@@ -1,14 +1,17 @@
 import os
+import io
 import time
 import logging
 import json
 import random
-import urllib
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import tweepy as tw
 import dataproccessor as dp
@@ -17,6 +20,7 @@ from geohelper import *
 jhu_path = os.getcwd() + '/jhu_data/'
 cdc_path = os.getcwd() + '/cdc_data/'
 plot_path = os.getcwd() + '/plots/'
+data_paths = {'cdc': cdc_path, 'jhu': jhu_path}
 twitter_file = os.getcwd() + '/twitter_creds.json'
 
 now = datetime.now()
@@ -27,6 +31,11 @@ log_format = '%(levelname)s | %(asctime)s | %(message)s'
 
 should_tweet = False
 should_save_jhu = False
+time_series_link = None
+prev_us_frame = None
+prev_ts_frame = None
+# The most recently saved frame for each source, kept so it doesn't have to be read back from disk every pass
+last_frames = {'jhu': None, 'cdc': None}
 
 state_map = {'AL': 'Alabama', 'AK': 'Alaska', 'AR': 'Arkansas', 'AZ': 'Arizona', 'CA': 'California', 'CO': 'Colorado',
              'CT': 'Connecticut', 'DE': 'Delaware', 'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii',
@@ -40,10 +49,7 @@ state_map = {'AL': 'Alabama', 'AK': 'Alaska', 'AR': 'Arkansas', 'AZ': 'Arizona',
              'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming', 'D.C.': 'Washington D.C', 'P.R.': 'Puerto Rico',
              'VI': 'Virgin Islands, U.S.'}
 
-state_abb_map = {}
-
-for name, abb in zip(state_map.values(), state_map.keys()):
-    state_abb_map[name] = abb
+state_abb_map = {name: abb for abb, name in state_map.items()}
 
 if os.path.exists(twitter_file):
     with open(twitter_file, 'r') as file:
@@ -84,18 +90,38 @@ logging.basicConfig(filename=log_path, format=log_format, filemode='w', level=lo
 
 logger = logging.getLogger()
 
+# Each thread gets its own session since requests does not guarantee a session is thread safe. The downloads run on a
+# long lived executor so its worker threads, and their sessions, keep connections alive from one loop to the next
+session_store = threading.local()
+executor = ThreadPoolExecutor(max_workers=2)
+request_timeout = 10
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the HTTP session belonging to the calling thread, creating it on first use
+    :return: A requests session that is only used by the current thread
+    """
+
+    if getattr(session_store, 'session', None) is None:
+        session_store.session = requests.Session()
+        session_store.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+    return session_store.session
+
 
 def get_jhu_data() -> pd.DataFrame:
     """
-    Reads the name of update files on JHU's Github, selects the most recent one, and then downloads that file as a
-    temp file to create a DataFrame. This DataFrame undergoes some reorganization to select for U.S data
+    Reads the name of update files on JHU's Github, selects the most recent one, and then downloads that file and reads
+    it into a DataFrame. This DataFrame undergoes some reorganization to select for U.S data
     :return A pandas dataframe with columns state, city, cases, deaths, recoveries
     """
     logger.info('Attempting to connect to JHU sheet')
 
     jhu_github_url = 'https://github.com/CSSEGISandData/COVID-19/tree/master/csse_covid_19_data/csse_covid_19_daily_reports'
-    github_req = requests.get(jhu_github_url)
-    git_soup = BeautifulSoup(github_req.content, features='html.parser')
+    github_req = get_session().get(jhu_github_url, timeout=request_timeout)
+    github_req.raise_for_status()
+    git_soup = BeautifulSoup(github_req.content, features='lxml')
 
     candidate_link = ''
     curr_low_diff = None
@@ -119,26 +145,30 @@ def get_jhu_data() -> pd.DataFrame:
                     candidate_link = link.get('href')
 
     file_link = str('https://raw.githubusercontent.com' + candidate_link).replace('blob/', '')
-    newest_csv_req = urllib.request.Request(file_link)
-    csv_file = urllib.request.urlopen(newest_csv_req)
-    csv_data = csv_file.read()
-
-    with open(jhu_path + 'jhu_temp.csv', 'wb') as file:
-        file.write(csv_data)
-
-    temp_frame = pd.read_csv(jhu_path + 'jhu_temp.csv')
-    us_frame = temp_frame[['Province/State', 'Country/Region', 'Confirmed', 'Deaths', 'Recovered']]
-    us_frame.rename(columns={'Province/State': 'case_loc'}, inplace=True)
-    is_US = us_frame['Country/Region'] == 'US'
-    us_frame = us_frame[is_US]
-    us_frame = us_frame[~us_frame['case_loc'].str.contains('Princess')]
-
-    us_frame = us_frame[['case_loc', 'Confirmed', 'Deaths', 'Recovered']]
-    rename_map = {'case_loc': 'state', 'Confirmed': 'cases', 'Deaths': 'deaths', 'Recovered': 'recoveries'}
-
-    us_frame.rename(columns=rename_map, inplace=True)
-
-    os.remove(jhu_path + 'jhu_temp.csv')
+    csv_req = get_session().get(file_link, timeout=request_timeout)
+    csv_req.raise_for_status()
+    csv_data = csv_req.content
+
+    # Parse the download straight from memory instead of round-tripping it through a temp file
+    temp_frame = pd.read_csv(io.BytesIO(csv_data),
+                             usecols=['Province/State', 'Country/Region', 'Confirmed', 'Deaths', 'Recovered'])
+    is_US = temp_frame['Country/Region'] == 'US'
+    us_frame = temp_frame[is_US]
+    us_frame = us_frame[~us_frame['Province/State'].str.contains('Princess', na=False)]
+
+    rename_map = {'Province/State': 'state', 'Confirmed': 'cases', 'Deaths': 'deaths', 'Recovered': 'recoveries'}
+    us_frame = us_frame[list(rename_map)].rename(columns=rename_map)
+
+    # Missing counts come through as blanks, so convert each count column in a single pass. int64 matches what read_csv
+    # gives back for saved data on every platform, so the two compare equal
+    count_columns = ['cases', 'deaths', 'recoveries']
+    us_frame[count_columns] = us_frame[count_columns].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+
+    # County level entries look like "Berkeley, CA", so expand their abbreviation to the full state name. Anything whose
+    # last part isn't an abbreviation (full state names, or Virgin Islands, U.S.) keeps its original value
+    locations = us_frame['state']
+    abbreviations = locations.str.split(',').str[-1].str.strip()
+    us_frame['state'] = abbreviations.map(state_map).fillna(locations)
 
     if us_frame.empty is not True:
         logger.info('Successfully downloaded JHU data! If new will save as jhu_{}'.format(now_file_ext))
@@ -151,50 +181,63 @@ def get_jhu_data() -> pd.DataFrame:
         should_tweet = True
         should_save_jhu = True
 
-        if get_most_recent_data('jhu').empty:
-            us_frame.to_csv(jhu_path + 'jhu_' + now_file_ext)
+        if newest_data.empty:
+            save_data(us_frame, 'jhu')
     else:
         logger.warning('Downloaded JHU data is not new! Will not save')
 
     return us_frame
 
 
-def make_state_objects_from_data(data: pd.DataFrame, from_csv=False) -> [State]:
+def make_state_objects_from_data(data: pd.DataFrame) -> [State]:
     """
     Creates either a city or state object from a DataFrame
-    :param from_csv: Should be true if the data was read in from a CSV to ensure correct column selection. Default false
     :param data: The DataFrame to assemble the object from
     :return: Either a city or state object, depending on what was specified
     """
 
-    state_objs = []
-    state_names = []
+    # Columns are selected by name, so data read in from a CSV (which has an extra index column) works the same way
+    columns = zip(data['state'].to_numpy(), data['cases'].to_numpy(), data['deaths'].to_numpy(),
+                  data['recoveries'].to_numpy())
+    # Objects are grouped by state in the order each state first appears in a single pass over the rows
+    states = {}
 
-    for name in data['state']:
-        if name not in state_names:
-            state_names.append(name)
+    for name, cases, deaths, recoveries in columns:
+        state_ob = State(state_name=name, state_cases=cases, state_deaths=deaths, state_recoveries=recoveries)
+        states.setdefault(name, []).append(state_ob)
 
-    for name in state_names:
-        for row_tuple in data.iterrows():
-            # Data read in from a CSV has an index column first, so we just have to shift over 1
-            if from_csv:
-                row_data = [entry for entry in row_tuple[1]]
-                if row_data[1] == name:
-                    case_dat = row_data[2:5]
-                    state_ob = State(state_name=name, state_cases=case_dat[0], state_deaths=case_dat[1],
-                                     state_recoveries=case_dat[2])
+    return [state_ob for state_obs in states.values() for state_ob in state_obs]
 
-                    state_objs.append(state_ob)
-            else:
-                row_data = [entry for entry in row_tuple[1]]
-                if row_data[0] == name:
-                    case_dat = row_data[1:4]
-                    state_ob = State(state_name=name, state_cases=case_dat[0], state_deaths=case_dat[1],
-                                     state_recoveries=case_dat[2])
 
-                    state_objs.append(state_ob)
+def get_time_series_link() -> str:
+    """
+    Finds the raw download link for the JHU time series sheet. The sheet rarely moves between updates, so the link is
+    scraped from Github once and reused until a download from it fails
+    :return: The URL of the raw time series CSV
+    """
+    global time_series_link
+
+    if time_series_link is None:
+        jhu_github_url = 'https://github.com/CSSEGISandData/COVID-19/tree/master/csse_covid_19_data/csse_covid_19_time_series'
+        github_req = get_session().get(jhu_github_url, timeout=request_timeout)
+        github_req.raise_for_status()
+        git_soup = BeautifulSoup(github_req.content, features='lxml')
+
+        candidate_link = ''
+
+        for link in git_soup.find_all('a'):
+            if link.get('title') == 'time_series_19-covid-Confirmed.csv':
+                candidate_link = link.get('href')
+
+        file_link = str('https://raw.githubusercontent.com' + candidate_link).replace('blob/', '')
+
+        # Only remember the link if the sheet was actually found so a bad page load is retried next time
+        if candidate_link != '':
+            time_series_link = file_link
+
+        return file_link
 
-    return state_objs
+    return time_series_link
 
 
 def get_time_series(from_file=False) -> pd.DataFrame:
@@ -204,31 +247,26 @@ def get_time_series(from_file=False) -> pd.DataFrame:
     :return: A dataframe of the time series data for the U.S with columns for the location at which is was discovered
     and a column for each day since tracking began.
     """
+    global time_series_link
 
     if from_file:
         return pd.read_csv(jhu_path + 'jhu_time.csv')
     else:
         logger.info('Attempting to download JHU time series sheet')
 
-        jhu_github_url = 'https://github.com/CSSEGISandData/COVID-19/tree/master/csse_covid_19_data/csse_covid_19_time_series'
-        github_req = requests.get(jhu_github_url)
-        git_soup = BeautifulSoup(github_req.content, features='html.parser')
+        file_link = get_time_series_link()
+        csv_req = get_session().get(file_link, timeout=request_timeout)
 
-        candidate_link = ''
+        try:
+            csv_req.raise_for_status()
+        except requests.HTTPError:
+            # The sheet may have been moved or renamed, so forget the link and find it again on the next pass
+            time_series_link = None
+            raise
 
-        for link in git_soup.find_all('a'):
-            if link.get('title') == 'time_series_19-covid-Confirmed.csv':
-                candidate_link = link.get('href')
-
-        file_link = str('https://raw.githubusercontent.com' + candidate_link).replace('blob/', '')
-        newest_csv_req = urllib.request.Request(file_link)
-        csv_file = urllib.request.urlopen(newest_csv_req)
-        csv_data = csv_file.read()
-
-        with open(jhu_path + 'jhu_time_temp.csv', 'wb') as file:
-            file.write(csv_data)
+        csv_data = csv_req.content
 
-        ts_conf_frame = pd.read_csv(jhu_path + 'jhu_time_temp.csv')
+        ts_conf_frame = pd.read_csv(io.BytesIO(csv_data))
         is_US = ts_conf_frame['Country/Region'] == 'US'
         ts_conf_frame = ts_conf_frame[is_US]
         ts_conf_frame = ts_conf_frame[~ts_conf_frame['Province/State'].str.contains('Princess')]
@@ -236,8 +274,6 @@ def get_time_series(from_file=False) -> pd.DataFrame:
         ts_conf_frame.drop(['Country/Region', 'Lat', 'Long'], axis=1, inplace=True)
         ts_conf_frame.rename(columns={'Province/State': 'state'}, inplace=True)
 
-        logger.info('Removing JHU temp file...')
-        os.remove(jhu_path + 'jhu_time_temp.csv')
         ts_conf_frame.to_csv(jhu_path + 'jhu_time.csv')
         logger.info('Saved time series data successfully!')
 
@@ -271,12 +307,13 @@ def get_data_for(name: str, var: str, data: pd.DataFrame, region='state') -> pd.
     :return: A Series containing the requested data
     """
 
+    # Exact matching so that e.g. Washington does not also select Washington D.C
     if region == 'state':
-        target_frame = data[data.state.str.contains(name)]
+        target_frame = data[data['state'].values == name]
 
         return target_frame[var]
     elif region == 'city':
-        target_frame = data[data.city.str.contains(name)]
+        target_frame = data[data['city'].values == name]
 
         return target_frame[var]
     else:
@@ -290,25 +327,9 @@ def make_state_frame(data: pd.DataFrame) -> pd.DataFrame:
     :param data: The dataframe to ready values from
     :return: A data frame containing the same data from the JHU frame but organized at the state level
     """
-    state_deaths = []
-    state_cases = []
-    state_recoveries = []
-    states = []
 
-    for state in data['state']:
-        deaths = get_data_for(state, 'deaths', data)
-        cases = get_data_for(state, 'cases', data)
-        recoveries = get_data_for(state, 'recoveries', data)
-
-        if state not in states:
-            states.append(state)
-            state_deaths.append(deaths.sum())
-            state_cases.append(cases.sum())
-            state_recoveries.append(recoveries.sum())
-
-    ret_data = {'state': states, 'cases': state_cases, 'deaths': state_deaths, 'recoveries': state_recoveries}
-
-    return pd.DataFrame(ret_data)
+    # sort=False keeps the states in the order they first appear in the data
+    return data.groupby('state', sort=False, as_index=False)[['cases', 'deaths', 'recoveries']].sum()
 
 
 def is_new_data(recent_data: pd.DataFrame, prev_data: pd.DataFrame, source: str):
@@ -320,49 +341,21 @@ def is_new_data(recent_data: pd.DataFrame, prev_data: pd.DataFrame, source: str)
     :return: True or false depending on whether or not the recent_data dataframe is newer than the previous one
     """
     columns = []
-    is_new = False
     if source == 'jhu':
         columns = ['state', 'cases', 'deaths', 'recoveries']
     if source == 'cdc':
         columns = ['measure', 'counts']
 
-    if prev_data.empty:
+    # Data saved in an older layout can't be compared, so treat it the same as having no data
+    if prev_data.empty or not set(columns).issubset(prev_data.columns):
         return True
     else:
-        # Since the CDC data is formatted consistently, particularly smart data checking is not needed
-        if source == 'cdc':
-            for column in columns:
-                for entry1, entry2 in zip(recent_data[column], prev_data[column]):
-                    if entry1 != entry2:
-                        is_new = True
-                        break
-        # JHU data requires a bit more thinking
-        if source == 'jhu':
-            states_new = []
-            states_old = []
-
-            # iterrows() returns a tuple of (index, data)
-            for tuple_new, tuple_old in zip(recent_data.iterrows(), prev_data.iterrows()):
-                # Iterates through each value in the row
-                row_data_new = [entry for entry in tuple_new[1]]
-                state_new = row_data_new[0]
-                case_data_new = row_data_new[1:4]
-
-                states_new.append(state_new)
-
-                # Data read from a CSV contains an index column, so data values are shifted one to the right
-                row_data_old = [entry for entry in tuple_old[1]]
-                state_old = row_data_old[1]
-                case_data_old = row_data_old[2:5]
-
-                states_old.append(state_old)
-
-            if states_new.sort() != states_old.sort():
-                is_new = True
-            if case_data_old != case_data_new:
-                is_new = True
-
-        return is_new
+        # Data read from a CSV carries its own index column, so only the shared columns are compared. Rows are sorted
+        # first so that a change in row order alone is not counted as new data
+        recent = recent_data[columns].sort_values(columns).reset_index(drop=True)
+        prev = prev_data[columns].sort_values(columns).reset_index(drop=True)
+
+        return not recent.equals(prev)
 
 
 def get_cdc_data() -> pd.DataFrame:
@@ -372,8 +365,9 @@ def get_cdc_data() -> pd.DataFrame:
     """
 
     cdc_url = 'https://www.cdc.gov/coronavirus/2019-ncov/cases-in-us.html'
-    cdc_page = requests.get(cdc_url)
-    cdc_soup = BeautifulSoup(cdc_page.content, features='html.parser')
+    cdc_page = get_session().get(cdc_url, timeout=request_timeout)
+    cdc_page.raise_for_status()
+    cdc_soup = BeautifulSoup(cdc_page.content, features='lxml')
 
     measures = []
     values = []
@@ -413,7 +407,7 @@ def get_cdc_data() -> pd.DataFrame:
     if is_new_data(frame, newest_data, 'cdc'):
         print('Found new CDC data! Saving...')
         logger.info('Found new CDC data! Now saving...')
-        frame.to_csv(cdc_path + 'cdc_' + now_file_ext)
+        save_data(frame, 'cdc')
         global should_tweet
         should_tweet = True
     else:
@@ -428,18 +422,11 @@ def load_all_data(data_type: str) -> []:
     :param data_type: What type of data to download. Valid types are jhu or cdc
     :return: A list of all files in the directory
     """
-    data = []
+    # Only data snapshots belong in the listing, so skip Finder metadata and the time series sheet
+    ignored_files = {'.DS_Store', 'jhu_time.csv'}
 
-    if data_type.lower() == 'cdc':
-        for file in os.listdir(cdc_path):
-            if file != '.DS_Store':
-                data.append(file)
-    if data_type.lower() == 'jhu':
-        for file in os.listdir(jhu_path):
-            if file != '.DS_Store' and file != 'jhu_time.csv':
-                data.append(file)
-
-    return data
+    with os.scandir(data_paths[data_type.lower()]) as entries:
+        return [entry.name for entry in entries if entry.name not in ignored_files]
 
 
 def get_most_recent_data(data_source: str) -> pd.DataFrame:
@@ -449,12 +436,17 @@ def get_most_recent_data(data_source: str) -> pd.DataFrame:
     :return: A dataframe of the most recently downloaded data of a certain type
     """
 
+    if last_frames[data_source] is not None:
+        return last_frames[data_source]
+
     candidate_file = ''
     # We look at the difference between right now and when the file was created, and select the lowest difference
     curr_lowest_diff = None
 
-    if load_all_data(data_source) != []:
-        for file in load_all_data(data_source):
+    data_files = load_all_data(data_source)
+
+    if data_files != []:
+        for file in data_files:
             file_time = file[5:18]
             time_components = file_time.split('_')
             file_datetime = datetime(2020, int(time_components[0]), int(time_components[1]),
@@ -470,16 +462,24 @@ def get_most_recent_data(data_source: str) -> pd.DataFrame:
                 curr_lowest_diff = time_diff
                 candidate_file = file
 
-        if data_source == 'jhu':
-            candidate_file = jhu_path + candidate_file
-        if data_source == 'cdc':
-            candidate_file = cdc_path + candidate_file
+        last_frames[data_source] = pd.read_csv(data_paths[data_source] + candidate_file)
 
-        return pd.read_csv(candidate_file)
+        return last_frames[data_source]
     else:
         return pd.DataFrame()
 
 
+def save_data(frame: pd.DataFrame, data_source: str):
+    """
+    Saves newly downloaded data and remembers it as the most recent data of its type
+    :param frame: The dataframe to save
+    :param data_source: The source of the data. Valid sources are jhu or cdc
+    """
+
+    frame.to_csv(data_paths[data_source] + data_source + '_' + now_file_ext)
+    last_frames[data_source] = frame
+
+
 def make_tweet(topic: str, updates: dict):
     """
     Creates a tweet to post to Twitter
@@ -548,17 +548,16 @@ def make_tweet(topic: str, updates: dict):
         api.update_status(status=text, media_ids=media_ids)
 
 
-def get_updated_states(new_data: pd.DataFrame, old_data: pd.DataFrame, old_from_csv=True) -> dict:
+def get_updated_states(new_data: pd.DataFrame, old_data: pd.DataFrame) -> dict:
     """
     Determines updates to state information
-    :param old_from_csv: Was the old data loaded from a CSV? Default is True
     :param old_data: The DataFrame to which the new data will be compared to
     :param new_data: A DataFrame containing state and city data
     :return: A dictionary containing the list of states with new cases, deaths, and recoveries
     """
 
     new_state_objs = make_state_objects_from_data(new_data)
-    old_state_objs = make_state_objects_from_data(old_data, from_csv=old_from_csv)
+    old_state_objs = make_state_objects_from_data(old_data)
 
     new_cases = []
     new_deaths = []
@@ -585,38 +584,67 @@ def get_updated_states(new_data: pd.DataFrame, old_data: pd.DataFrame, old_from_
     return {'cases': new_cases, 'deaths': new_deaths, 'recoveries': new_recoveries}
 
 
-def main(first_run=True):
-    if first_run:
-        if os.path.exists(cdc_path) is not True:
-            try:
-                os.mkdir(cdc_path)
-            except OSError as error:
-                logger.critical(f'Could not create CDC data directory because {error.strerror}!')
-        if os.path.exists(jhu_path) is not True:
-            try:
-                os.mkdir(jhu_path)
-            except OSError as error:
-                logger.critical(f'Could not create JHU data directory because {error.strerror}!')
-        if os.path.exists(plot_path) is not True:
-            try:
-                os.mkdir(plot_path)
-            except OSError as error:
-                logger.critical(f'Could not create plots directory because {error.strerror}!')
+def setup():
+    """
+    Creates the data and plot directories if they do not exist yet and prints the tracker banner
+    """
 
-    logger.info('Starting tracker loop')
+    if os.path.exists(cdc_path) is not True:
+        try:
+            os.mkdir(cdc_path)
+        except OSError as error:
+            logger.critical(f'Could not create CDC data directory because {error.strerror}!')
+    if os.path.exists(jhu_path) is not True:
+        try:
+            os.mkdir(jhu_path)
+        except OSError as error:
+            logger.critical(f'Could not create JHU data directory because {error.strerror}!')
+    if os.path.exists(plot_path) is not True:
+        try:
+            os.mkdir(plot_path)
+        except OSError as error:
+            logger.critical(f'Could not create plots directory because {error.strerror}!')
 
     spacer = ' ' * 10
 
-    if first_run:
-        print('=' * 50,
-              '\n',
-              spacer + 'COVID-19 Tracker (U.S)\n',
-              '=' * 50)
-        print('To break this program out of its loop, press Ctrl+C')
+    print('=' * 50,
+          '\n',
+          spacer + 'COVID-19 Tracker (U.S)\n',
+          '=' * 50)
+    print('To break this program out of its loop, press Ctrl+C')
 
-    us_frame = get_jhu_data()
 
-    dp.make_plots([us_frame, get_time_series()])
+def fetch_and_plot():
+    """
+    Runs a single pass of the tracker: downloads the newest data, rebuilds the plots if needed, and tweets and saves
+    any new data
+    """
+    global now
+    global now_file_ext
+    global should_tweet
+    global should_save_jhu
+    global prev_us_frame
+    global prev_ts_frame
+
+    # Each pass needs a fresh timestamp for file names and flags that only reflect this pass's data
+    now = datetime.now()
+    now_file_ext = now.strftime('%m_%d_%H_%M_%S.csv')
+    should_tweet = False
+    should_save_jhu = False
+
+    # Both downloads are independent network requests, so fetch them side by side
+    jhu_future = executor.submit(get_jhu_data)
+    time_future = executor.submit(get_time_series)
+    us_frame = jhu_future.result()
+    ts_frame = time_future.result()
+
+    # Plotting is the slowest part of the loop, so only redraw when the data behind the plots has changed
+    if prev_us_frame is not None and us_frame.equals(prev_us_frame) and ts_frame.equals(prev_ts_frame):
+        logger.info('Data unchanged since the last plots were made! Skipping plots')
+    else:
+        dp.make_plots([us_frame, ts_frame])
+        prev_us_frame = us_frame
+        prev_ts_frame = ts_frame
 
     if should_tweet:
         # File saving had to be moved down here or else the tweet formatter would not be able to detect new data
@@ -626,16 +654,28 @@ def main(first_run=True):
         if should_save_jhu:
             print('Found new JHU data! Saving...')
             logger.info('Found new JHU data! Now saving...')
-            us_frame.to_csv(jhu_path + 'jhu_' + now_file_ext)
+            save_data(us_frame, 'jhu')
+
+
+def main():
+    setup()
+
+    logger.info('Starting tracker loop')
 
     try:
         while True:
+            # A slow or failed download shouldn't end the tracker, so skip this pass and try again after sleeping
+            try:
+                fetch_and_plot()
+            except requests.RequestException as error:
+                print('Could not download new data! Will try again next time...')
+                logger.error(f'Could not download new data because {error}! Skipping this pass')
+
             print('Sleeping now for 30 minutes! Will check for new data afterwards...')
             time.sleep(60 * 30)
-            main(first_run=False)
-            break
     except KeyboardInterrupt:
         print('Exiting...')
+        executor.shutdown()
 
 
 if __name__ == '__main__':
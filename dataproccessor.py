@@ -1,6 +1,5 @@
-import math
-
 import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
 import numpy as np
 import pandas as pd
 
@@ -40,9 +39,9 @@ def make_plots(data: [pd.DataFrame]):
     state_frame = ct.make_state_frame(us_frame)
     pos = np.arange(len(state_frame['state']))
     width = 0.7
-    # Interval is [Start, Stop) so we need to go one more
     plt.gcf().set_size_inches(14, 14)
-    plt.yticks(np.arange(start=0, stop=state_frame['cases'].max() + 1, step=20))
+    # Let matplotlib pick around ten whole-number ticks instead of one every 20 cases up to the max
+    plt.gca().yaxis.set_major_locator(MaxNLocator(nbins=10, integer=True))
     case_bar = plt.bar(pos, state_frame['cases'], width, label='Cases')
     death_bar = plt.bar(pos, state_frame['deaths'], width, label='Deaths')
     recov_bar = plt.bar(pos, state_frame['recoveries'], width,
@@ -70,6 +69,7 @@ def make_time_series_plot(freqs: list):
     :param freqs: The number of cases for each day of the outbreak
     """
 
+    freqs = np.asarray(freqs, dtype=np.float64)
     days = len(freqs)
     fig, (reg_ax, log_ax) = plt.subplots(1, 2)
 
@@ -81,7 +81,7 @@ def make_time_series_plot(freqs: list):
     reg_ax.set_xlabel('Days Since 01/21/2020')
     reg_ax.set_ylabel('Number of cases')
 
-    log_freqs = [math.log(freq) for freq in freqs]
+    log_freqs = np.log(freqs)
 
     log_ax.plot(np.arange(start=1, stop=days + 1), log_freqs, color='red')
     log_ax.set_xlabel('Days Since 01/21/2020')
@@ -99,8 +99,7 @@ def get_country_cumulative(data: pd.DataFrame) -> list:
     :return: A list of the number of cases for each day
     """
 
-    rates = [data[column].tolist() for column in data.columns if column != 'state' and column != 'city']
-    daily_rates = [np.sum(day_rate) for day_rate in rates]
+    day_columns = data.columns.drop(['state', 'city'], errors='ignore')
 
-    return daily_rates
+    return data[day_columns].to_numpy().sum(axis=0).tolist()
 